@@ -33,10 +33,12 @@ def upgrade():
     conn = op.get_bind()
 
     # The type string for `Data` nodes changed from `data.*` to `node.data.*`.
+    # Since the prefix is literal and anchored at the start, a string concatenation suffices and is cheaper than a
+    # regular expression.
     statement = text(
         r"""
         UPDATE db_dbnode
-        SET type = regexp_replace(type, '^data.', 'node.data.')
+        SET type = 'node.' || type
         WHERE type LIKE 'data.%'
     """
     )
@@ -10,8 +10,9 @@
 # pylint: disable=too-many-branches,too-many-lines,too-many-locals,too-many-statements
 """Import an archive."""
 from dataclasses import dataclass
+import json
 from pathlib import Path
-from typing import Callable, Dict, Literal, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Literal, Optional, Set, Tuple, Union
 
 from tabulate import tabulate
 
@@ -209,18 +210,25 @@ def import_archive(
 
 
 def _add_new_entities(
-    etype: EntityTypes, total: int, unique_field: str, backend_unique_id: dict, backend_from: StorageBackend,
-    backend_to: StorageBackend, query_params: QueryParams, transform: Callable[[dict], dict]
+    etype: EntityTypes,
+    total: int,
+    unique_field: str,
+    input_unique_fields: Iterable[Any],
+    backend_unique_id: dict,
+    backend_from: StorageBackend,
+    backend_to: StorageBackend,
+    query_params: QueryParams,
+    transform: Callable[[dict], dict],
 ) -> None:
-    """Add new entities to the output backend and update the mapping of unique field -> id."""
+    """Add new entities to the output backend and update the mapping of unique field -> id.
+
+    :param input_unique_fields: the unique field values of all entities in the input backend,
+        as already retrieved by the caller, so that the input backend is not queried for them again
+    """
     IMPORT_LOGGER.report(f'Adding {total} new {etype.value}(s)')
 
     # collect the unique entities from the input backend to be added to the output backend
-    ufields = []
-    query = QueryBuilder(backend=backend_from).append(entity_type_to_orm[etype], project=unique_field)
-    for (ufield,) in query.distinct().iterall(batch_size=query_params.batch_size):
-        if ufield not in backend_unique_id:
-            ufields.append(ufield)
+    ufields = [ufield for ufield in input_unique_fields if ufield not in backend_unique_id]
 
     with get_progress_reporter()(desc=f'Adding new {etype.value}(s)', total=total) as progress:
         # batch the filtering of rows by filter size, to limit the number of query variables used in any one query,
@@ -251,7 +259,9 @@ def _import_users(backend_from: StorageBackend, backend_to: StorageBackend,
     """
     # get the records from the input backend
     qbuilder = QueryBuilder(backend=backend_from)
-    input_id_email = dict(qbuilder.append(orm.User, project=['id', 'email']).all(batch_size=query_params.batch_size))
+    input_id_email = dict(
+        qbuilder.append(orm.User, project=['id', 'email']).iterall(batch_size=query_params.batch_size)
+    )
 
     # get matching emails from the backend
     output_email_id: Dict[str, int] = {}
@@ -263,7 +273,7 @@ def _import_users(backend_from: StorageBackend, backend_to: StorageBackend,
                 'email': {
                     'in': list(input_id_email.values())
                 }
-            }, project=['email', 'id']).all(batch_size=query_params.batch_size)
+            }, project=['email', 'id']).iterall(batch_size=query_params.batch_size)
         )
 
     new_users = len(input_id_email) - len(output_email_id)
@@ -275,7 +285,8 @@ def _import_users(backend_from: StorageBackend, backend_to: StorageBackend,
         # add new users and update output_email_id with their email -> id mapping
         transform = lambda row: {k: v for k, v in row['entity'].items() if k != 'id'}
         _add_new_entities(
-            EntityTypes.USER, new_users, 'email', output_email_id, backend_from, backend_to, query_params, transform
+            EntityTypes.USER, new_users, 'email', input_id_email.values(), output_email_id, backend_from, backend_to,
+            query_params, transform
         )
 
     # generate mapping of input backend id to output backend id
@@ -290,7 +301,9 @@ def _import_computers(backend_from: StorageBackend, backend_to: StorageBackend,
     """
     # get the records from the input backend
     qbuilder = QueryBuilder(backend=backend_from)
-    input_id_uuid = dict(qbuilder.append(orm.Computer, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
+    input_id_uuid = dict(
+        qbuilder.append(orm.Computer, project=['id', 'uuid']).iterall(batch_size=query_params.batch_size)
+    )
 
     # get matching uuids from the backend
     backend_uuid_id: Dict[str, int] = {}
@@ -302,7 +315,7 @@ def _import_computers(backend_from: StorageBackend, backend_to: StorageBackend,
                 'uuid': {
                     'in': list(input_id_uuid.values())
                 }
-            }, project=['uuid', 'id']).all(batch_size=query_params.batch_size)
+            }, project=['uuid', 'id']).iterall(batch_size=query_params.batch_size)
         )
 
     new_computers = len(input_id_uuid) - len(backend_uuid_id)
@@ -341,8 +354,8 @@ def _import_computers(backend_from: StorageBackend, backend_to: StorageBackend,
             return data
 
         _add_new_entities(
-            EntityTypes.COMPUTER, new_computers, 'uuid', backend_uuid_id, backend_from, backend_to, query_params,
-            transform
+            EntityTypes.COMPUTER, new_computers, 'uuid', input_id_uuid.values(), backend_uuid_id, backend_from,
+            backend_to, query_params, transform
         )
 
         if relabelled:
@@ -393,7 +406,7 @@ def _import_authinfos(
             project=['id', 'aiidauser_id', 'dbcomputer_id']
         )
         backend_id_user_comp = [(user_id, comp_id)
-                                for _, user_id, comp_id in qbuilder.all(batch_size=query_params.batch_size)
+                                for _, user_id, comp_id in qbuilder.iterall(batch_size=query_params.batch_size)
                                 if (user_id, comp_id) in to_user_id_comp_id]
 
     new_authinfos = len(input_id_user_comp) - len(backend_id_user_comp)
@@ -447,7 +460,7 @@ def _import_nodes(
     IMPORT_LOGGER.report('Collecting Node(s) ...')
     # get the records from the input backend
     qbuilder = QueryBuilder(backend=backend_from)
-    input_id_uuid = dict(qbuilder.append(orm.Node, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
+    input_id_uuid = dict(qbuilder.append(orm.Node, project=['id', 'uuid']).iterall(batch_size=query_params.batch_size))
 
     # get matching uuids from the backend
     backend_uuid_id: Dict[str, int] = {}
@@ -459,7 +472,7 @@ def _import_nodes(
                 'uuid': {
                     'in': list(input_id_uuid.values())
                 }
-            }, project=['uuid', 'id']).all(batch_size=query_params.batch_size)
+            }, project=['uuid', 'id']).iterall(batch_size=query_params.batch_size)
         )
 
     new_nodes = len(input_id_uuid) - len(backend_uuid_id)
@@ -471,7 +484,8 @@ def _import_nodes(
         # add new nodes and update backend_uuid_id with their uuid -> id mapping
         transform = NodeTransform(user_ids_archive_backend, computer_ids_archive_backend, import_new_extras)
         _add_new_entities(
-            EntityTypes.NODE, new_nodes, 'uuid', backend_uuid_id, backend_from, backend_to, query_params, transform
+            EntityTypes.NODE, new_nodes, 'uuid', input_id_uuid.values(), backend_uuid_id, backend_from, backend_to,
+            query_params, transform
         )
 
     # generate mapping of input backend id to output backend id
@@ -488,11 +502,13 @@ class NodeTransform:
         self.user_ids_archive_backend = user_ids_archive_backend
         self.computer_ids_archive_backend = computer_ids_archive_backend
         self.import_new_extras = import_new_extras
+        self.checkpoint_key = orm.ProcessNode.CHECKPOINT_KEY
 
     def __call__(self, row: dict) -> dict:
         """Perform the transform."""
         data = row['entity']
         pk = data.pop('id')
+        node_type = data.get('node_type', '')
         try:
             data['user_id'] = self.user_ids_archive_backend[data['user_id']]
         except KeyError as exc:
@@ -505,13 +521,13 @@ class NodeTransform:
         if self.import_new_extras:
             # Remove node hashing and other aiida "private" extras
             data['extras'] = {k: v for k, v in data['extras'].items() if not k.startswith('_aiida_')}
-            if data.get('node_type', '').endswith('code.Code.'):
+            if node_type.endswith('code.Code.'):
                 data['extras'].pop('hidden', None)
         else:
             data['extras'] = {}
-        if data.get('node_type', '').startswith('process.'):
+        if node_type.startswith('process.'):
             # remove checkpoint from attributes of process nodes
-            data['attributes'].pop(orm.ProcessNode.CHECKPOINT_KEY, None)
+            data['attributes'].pop(self.checkpoint_key, None)
         return data
 
 
@@ -527,7 +543,7 @@ def _import_logs(
     """
     # get the records from the input backend
     qbuilder = QueryBuilder(backend=backend_from)
-    input_id_uuid = dict(qbuilder.append(orm.Log, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
+    input_id_uuid = dict(qbuilder.append(orm.Log, project=['id', 'uuid']).iterall(batch_size=query_params.batch_size))
 
     # get matching uuids from the backend
     backend_uuid_id: Dict[str, int] = {}
@@ -539,7 +555,7 @@ def _import_logs(
                 'uuid': {
                     'in': list(input_id_uuid.values())
                 }
-            }, project=['uuid', 'id']).all(batch_size=query_params.batch_size)
+            }, project=['uuid', 'id']).iterall(batch_size=query_params.batch_size)
         )
 
     new_logs = len(input_id_uuid) - len(backend_uuid_id)
@@ -559,7 +575,8 @@ def _import_logs(
             return data
 
         _add_new_entities(
-            EntityTypes.LOG, new_logs, 'uuid', backend_uuid_id, backend_from, backend_to, query_params, transform
+            EntityTypes.LOG, new_logs, 'uuid', input_id_uuid.values(), backend_uuid_id, backend_from, backend_to,
+            query_params, transform
         )
 
     # generate mapping of input backend id to output backend id
@@ -622,61 +639,30 @@ def _merge_node_extras(
             f'Number of Nodes in archive ({input_extras.count()}) and backend ({backend_extras.count()}) do not match'
         )
 
-    def _transform(data: Tuple[Tuple[str, dict], Tuple[str, dict]]) -> dict:
-        """Transform the new and existing extras into a dict that can be passed to bulk_update."""
+    def _transform(data: Tuple[Tuple[str, dict], Tuple[str, dict]]) -> Optional[dict]:
+        """Transform the new and existing extras into a dict that can be passed to bulk_update.
+
+        :returns: the update dict, or ``None`` if the merge leaves the existing extras unchanged
+        """
         new_uuid, new_extras = data[0]
         old_uuid, old_extras = data[1]
         if new_uuid != old_uuid:
             raise ImportValidationError(f'UUID mismatch when merging node extras: {new_uuid} != {old_uuid}')
-        backend_id = backend_uuid_id[new_uuid]
-        old_keys = set(old_extras.keys())
-        new_keys = set(new_extras.keys())
-        collided_keys = old_keys.intersection(new_keys)
-        old_keys_only = old_keys.difference(collided_keys)
-        new_keys_only = new_keys.difference(collided_keys)
-
-        final_extras = {}
 
         if mode == ('k', 'c', 'u'):
             # 'update_existing' operation: if an extra already exists,
             # overwrite its new value with a new one
-            final_extras = new_extras
-            for key in old_keys_only:
-                final_extras[key] = old_extras[key]
-            return {'id': backend_id, 'extras': final_extras}
-
-        if mode == ('k', 'c', 'l'):
+            final_extras = {**old_extras, **new_extras}
+        elif mode == ('k', 'c', 'l'):
             # 'keep_existing': if an extra already exists, keep its original value
-            final_extras = old_extras
-            for key in new_keys_only:
-                final_extras[key] = new_extras[key]
-            return {'id': backend_id, 'extras': final_extras}
-
-        if mode[0] == 'k':
-            for key in old_keys_only:
-                final_extras[key] = old_extras[key]
-        elif mode[0] != 'n':
-            raise ImportValidationError(
-                f"Unknown first letter of the update extras mode: '{mode}'. Should be either 'k' or 'n'"
-            )
-        if mode[1] == 'c':
-            for key in new_keys_only:
-                final_extras[key] = new_extras[key]
-        elif mode[1] != 'n':
-            raise ImportValidationError(
-                f"Unknown second letter of the update extras mode: '{mode}'. Should be either 'c' or 'n'"
-            )
-        if mode[2] == 'u':
-            for key in collided_keys:
-                final_extras[key] = new_extras[key]
-        elif mode[2] == 'l':
-            for key in collided_keys:
-                final_extras[key] = old_extras[key]
-        elif mode[2] != 'd':
-            raise ImportValidationError(
-                f"Unknown third letter of the update extras mode: '{mode}'. Should be one of 'u'/'l'/'a'/'d'"
-            )
-        return {'id': backend_id, 'extras': final_extras}
+            final_extras = {**new_extras, **old_extras}
+        else:
+            final_extras = _merge_extras_generic(old_extras, new_extras, mode)
+
+        # the serialized extras are compared as well, since e.g. ``1 == 1.0 == True`` in Python, but not in the database
+        if final_extras == old_extras and _serialize_extras(final_extras) == _serialize_extras(old_extras):
+            return None
+        return {'id': backend_uuid_id[new_uuid], 'extras': final_extras}
 
     with get_progress_reporter()(desc='Merging extras', total=input_extras.count()) as progress:
         for nrows, rows in batch_iter(
@@ -685,10 +671,57 @@ def _merge_node_extras(
                 backend_extras.iterall(batch_size=query_params.batch_size)
             ), query_params.batch_size, _transform
         ):
-            backend_to.bulk_update(EntityTypes.NODE, rows)
+            backend_to.bulk_update(EntityTypes.NODE, [row for row in rows if row is not None])
             progress.update(nrows)
 
 
+def _serialize_extras(extras: dict) -> str:
+    """Serialize extras, distinguishing values that Python considers equal, such as ``1``, ``1.0`` and ``True``."""
+    return json.dumps(extras, sort_keys=True)
+
+
+def _merge_extras_generic(old_extras: dict, new_extras: dict, mode: MergeExtrasType) -> dict:
+    """Merge two extras dictionaries, according to a generic three letter merge mode.
+
+    :param old_extras: the extras of the node in the output backend
+    :param new_extras: the extras of the node in the input backend
+    :param mode: tuple of merge modes for extras
+    """
+    old_keys = set(old_extras.keys())
+    new_keys = set(new_extras.keys())
+    collided_keys = old_keys.intersection(new_keys)
+    old_keys_only = old_keys.difference(collided_keys)
+    new_keys_only = new_keys.difference(collided_keys)
+
+    final_extras = {}
+
+    if mode[0] == 'k':
+        for key in old_keys_only:
+            final_extras[key] = old_extras[key]
+    elif mode[0] != 'n':
+        raise ImportValidationError(
+            f"Unknown first letter of the update extras mode: '{mode}'. Should be either 'k' or 'n'"
+        )
+    if mode[1] == 'c':
+        for key in new_keys_only:
+            final_extras[key] = new_extras[key]
+    elif mode[1] != 'n':
+        raise ImportValidationError(
+            f"Unknown second letter of the update extras mode: '{mode}'. Should be either 'c' or 'n'"
+        )
+    if mode[2] == 'u':
+        for key in collided_keys:
+            final_extras[key] = new_extras[key]
+    elif mode[2] == 'l':
+        for key in collided_keys:
+            final_extras[key] = old_extras[key]
+    elif mode[2] != 'd':
+        raise ImportValidationError(
+            f"Unknown third letter of the update extras mode: '{mode}'. Should be one of 'u'/'l'/'a'/'d'"
+        )
+    return final_extras
+
+
 class CommentTransform:
     """Callable to transform a Comment DB row, between the source archive and target backend."""
 
@@ -729,7 +762,9 @@ def _import_comments(
     """
     # get the records from the input backend
     qbuilder = QueryBuilder(backend=backend_from)
-    input_id_uuid = dict(qbuilder.append(orm.Comment, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
+    input_id_uuid = dict(
+        qbuilder.append(orm.Comment, project=['id', 'uuid']).iterall(batch_size=query_params.batch_size)
+    )
 
     # get matching uuids from the backend
     backend_uuid_id: Dict[str, int] = {}
@@ -741,7 +776,7 @@ def _import_comments(
                 'uuid': {
                     'in': list(input_id_uuid.values())
                 }
-            }, project=['uuid', 'id']).all(batch_size=query_params.batch_size)
+            }, project=['uuid', 'id']).iterall(batch_size=query_params.batch_size)
         )
 
     new_comments = len(input_id_uuid) - len(backend_uuid_id)
@@ -773,18 +808,21 @@ def _import_comments(
         elif merge_comments == 'newest':
             IMPORT_LOGGER.report(f'Updating {existing_comments} existing Comment(s)')
 
+            uuid_filters = {'uuid': {'in': list(backend_uuid_id.keys())}}
+            query = QueryBuilder(backend=backend).append(orm.Comment, filters=uuid_filters, project=['uuid', 'mtime'])
+            backend_uuid_mtime = dict(query.iterall(batch_size=query_params.batch_size))
+
             def _transform(row):
-                # to-do this is probably not the most efficient way to do this
                 uuid, new_mtime, new_comment = row
-                cmt = orm.Comment.collection.get(uuid=uuid)
-                if cmt.mtime < new_mtime:
-                    cmt.set_mtime(new_mtime)
-                    cmt.set_content(new_comment)
+                if backend_uuid_mtime[uuid] < new_mtime:
+                    return {'id': backend_uuid_id[uuid], 'mtime': new_mtime, 'content': new_comment}
+                return None
 
             with get_progress_reporter()(desc='Updating comments', total=archive_comments.count()) as progress:
                 for nrows, rows in batch_iter(
                     archive_comments.iterall(batch_size=query_params.batch_size), query_params.batch_size, _transform
                 ):
+                    backend.bulk_update(EntityTypes.COMMENT, [row for row in rows if row is not None])
                     progress.update(nrows)
 
         else:
@@ -792,8 +830,8 @@ def _import_comments(
     if new_comments:
         # add new comments and update backend_uuid_id with their uuid -> id mapping
         _add_new_entities(
-            EntityTypes.COMMENT, new_comments, 'uuid', backend_uuid_id, backend_from, backend, query_params,
-            CommentTransform(user_ids_archive_backend, node_ids_archive_backend)
+            EntityTypes.COMMENT, new_comments, 'uuid', input_id_uuid.values(), backend_uuid_id, backend_from, backend,
+            query_params, CommentTransform(user_ids_archive_backend, node_ids_archive_backend)
         )
 
     # generate mapping of input backend id to output backend id
@@ -854,29 +892,42 @@ def _import_links(
         if not total:
             continue  # nothing to add
 
-        # get existing links set, to check existing
+        unique_in_id_label = 'in_id_label' in link_uniqueness
+        unique_out_id = 'out_id' in link_uniqueness
+        unique_out_id_label = 'out_id_label' in link_uniqueness
+
+        # get existing links set, to check existing, and the additional validators, in a single pass over the links
+        # note, we only populate the validators when required, to reduce memory usage,
+        # and share a single string object per distinct label, since labels are heavily repeated across links
         IMPORT_LOGGER.report(f'Gathering existing {link_type.value!r} Link(s)')
-        existing_links = {
-            tuple(link) for link in orm.QueryBuilder(backend=backend_to).
-            append(entity_type='link', filters={
-                'type': link_type.value
-            }, project=['input_id', 'output_id', 'label']).iterall(batch_size=query_params.batch_size)
-        }
-        # create additional validators
-        # note, we only populate them when required, to reduce memory usage
-        existing_in_id_label = {(l[0], l[2]) for l in existing_links} if 'in_id_label' in link_uniqueness else set()
-        existing_out_id = {l[1] for l in existing_links} if 'out_id' in link_uniqueness else set()
-        existing_out_id_label = {(l[1], l[2]) for l in existing_links} if 'out_id_label' in link_uniqueness else set()
+        labels: Dict[str, str] = {}
+        existing_links: Set[Tuple[int, int, str]] = set()
+        existing_in_id_label: Set[Tuple[int, str]] = set()
+        existing_out_id: Set[int] = set()
+        existing_out_id_label: Set[Tuple[int, str]] = set()
+        query = orm.QueryBuilder(backend=backend_to)
+        query.append(entity_type='link', filters={'type': link_type.value}, project=['input_id', 'output_id', 'label'])
+        for in_id, out_id, link_label in query.iterall(batch_size=query_params.batch_size):
+            link_label = labels.setdefault(link_label, link_label)
+            existing_links.add((in_id, out_id, link_label))
+            if unique_in_id_label:
+                existing_in_id_label.add((in_id, link_label))
+            if unique_out_id:
+                existing_out_id.add(out_id)
+            if unique_out_id_label:
+                existing_out_id_label.add((out_id, link_label))
 
         # loop through archive links; validate and add new
         new_count = existing_count = 0
         insert_rows = []
+        # the progress is only updated once per batch, since this loop is CPU bound for large archives
+        link_count = 0
         with get_progress_reporter()(desc=f'Processing {link_type.value!r} Link(s)', total=total) as progress:
-            for in_id, in_type, out_id, out_type, link_id, link_label in archive_query.iterall(
-                batch_size=query_params.batch_size
-            ):
+            for link_count, row in enumerate(archive_query.iterall(batch_size=query_params.batch_size), 1):
+                in_id, in_type, out_id, out_type, link_id, link_label = row
 
-                progress.update()
+                if (link_count % query_params.batch_size) == 0:
+                    progress.update(query_params.batch_size)
 
                 # convert ids: archive -> profile
                 try:
@@ -902,18 +953,19 @@ def _import_links(
                     )
                 if not out_type.startswith(allowed_out_type):
                     raise ImportValidationError(f'Cannot add a {link_type.value!r} link to {out_type} (link {link_id})')
-                if 'in_id_label' in link_uniqueness and (in_id, link_label) in existing_in_id_label:
+                if unique_in_id_label and (in_id, link_label) in existing_in_id_label:
                     raise ImportUniquenessError(
                         f'Node {in_id} already has an outgoing {link_type.value!r} link with label {link_label!r}'
                     )
-                if 'out_id' in link_uniqueness and out_id in existing_out_id_label:
+                if unique_out_id and out_id in existing_out_id:
                     raise ImportUniquenessError(f'Node {out_id} already has an incoming {link_type.value!r} link')
-                if 'out_id_label' in link_uniqueness and (out_id, link_label) in existing_out_id_label:
+                if unique_out_id_label and (out_id, link_label) in existing_out_id_label:
                     raise ImportUniquenessError(
                         f'Node {out_id} already has an incoming {link_type.value!r} link with label {link_label!r}'
                     )
 
                 # update variables
+                link_label = labels.setdefault(link_label, link_label)
                 new_count += 1
                 insert_rows.append({
                     'input_id': in_id,
@@ -922,9 +974,12 @@ def _import_links(
                     'label': link_label,
                 })
                 existing_links.add((in_id, out_id, link_label))
-                existing_in_id_label.add((in_id, link_label))
-                existing_out_id.add(out_id)
-                existing_out_id_label.add((out_id, link_label))
+                if unique_in_id_label:
+                    existing_in_id_label.add((in_id, link_label))
+                if unique_out_id:
+                    existing_out_id.add(out_id)
+                if unique_out_id_label:
+                    existing_out_id_label.add((out_id, link_label))
 
                 # flush new rows, once batch size is reached
                 if (new_count % query_params.batch_size) == 0:
@@ -934,6 +989,7 @@ def _import_links(
             # flush remaining new rows
             if insert_rows:
                 backend_to.bulk_insert(EntityTypes.LINK, insert_rows)
+            progress.update(link_count % query_params.batch_size)
 
         # report counts
         if existing_count:
@@ -984,7 +1040,7 @@ def _import_groups(
     """
     # get the records from the input backend
     qbuilder = QueryBuilder(backend=backend_from)
-    input_id_uuid = dict(qbuilder.append(orm.Group, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
+    input_id_uuid = dict(qbuilder.append(orm.Group, project=['id', 'uuid']).iterall(batch_size=query_params.batch_size))
 
     # get matching uuids from the backend
     backend_uuid_id: Dict[str, int] = {}
@@ -996,7 +1052,7 @@ def _import_groups(
                 'uuid': {
                     'in': list(input_id_uuid.values())
                 }
-            }, project=['uuid', 'id']).all(batch_size=query_params.batch_size)
+            }, project=['uuid', 'id']).iterall(batch_size=query_params.batch_size)
         )
 
     # get all labels
@@ -1017,7 +1073,8 @@ def _import_groups(
         transform = GroupTransform(user_ids_archive_backend, labels)
 
         _add_new_entities(
-            EntityTypes.GROUP, new_groups, 'uuid', backend_uuid_id, backend_from, backend_to, query_params, transform
+            EntityTypes.GROUP, new_groups, 'uuid', input_id_uuid.values(), backend_uuid_id, backend_from, backend_to,
+            query_params, transform
         )
 
         if transform.relabelled:
@@ -1126,9 +1183,12 @@ def _get_new_object_keys(
     archive_hashkeys: Set[str] = set()
     query = QueryBuilder(backend=backend_from).append(orm.Node, project='repository_metadata')
     with get_progress_reporter()(desc='Collecting archive Node file keys', total=query.count()) as progress:
-        for repository_metadata, in query.iterall(batch_size=query_params.batch_size):
-            archive_hashkeys.update(key for key in Repository.flatten(repository_metadata).values() if key is not None)
-            progress.update()
+        for nrows, rows in batch_iter(query.iterall(batch_size=query_params.batch_size), query_params.batch_size):
+            for repository_metadata, in rows:
+                archive_hashkeys.update(
+                    key for key in Repository.flatten(repository_metadata).values() if key is not None
+                )
+            progress.update(nrows)
 
     IMPORT_LOGGER.report('Checking keys against repository ...')
 
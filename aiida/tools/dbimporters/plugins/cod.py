@@ -12,6 +12,17 @@
 from aiida.tools.dbimporters.baseclasses import CifEntry, DbImporter, DbSearchResults
 
 
+def _sql_literal(value):
+    """
+    Returns a MySQL literal for a bound query parameter, used to render
+    a parameterized statement as plain text.
+    """
+    if isinstance(value, (int, float)):
+        return str(value)
+    escaped = str(value).replace('\\', '\\\\').replace("'", "\\'")
+    return f"'{escaped}'"
+
+
 class CodDbImporter(DbImporter):
     """
     Database importer for Crystallography Open Database.
@@ -19,85 +30,67 @@ class CodDbImporter(DbImporter):
 
     def _int_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for querying integer fields.
+        Returns SQL query predicate and parameters for querying integer fields.
         """
-        for value in values:
-            if not isinstance(value, int) and not isinstance(value, str):
-                raise ValueError(f"incorrect value for keyword '{alias}' only integers and strings are accepted")
-        return f"{key} IN ({', '.join(str(int(i)) for i in values)})"
+        if not all(isinstance(value, (int, str)) for value in values):
+            raise ValueError(f"incorrect value for keyword '{alias}' only integers and strings are accepted")
+        return f"{key} IN ({', '.join(['%s'] * len(values))})", list(map(int, values))
 
     def _str_exact_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for querying string fields.
+        Returns SQL query predicate and parameters for querying string fields.
         """
-        clause_parts = []
-        for value in values:
-            if not isinstance(value, int) and not isinstance(value, str):
-                raise ValueError(f"incorrect value for keyword '{alias}' only integers and strings are accepted")
-            if isinstance(value, int):
-                value = str(value)
-            clause_parts.append(f"'{value}'")
-        return f"{key} IN ({', '.join(clause_parts)})"
+        if not all(isinstance(value, (int, str)) for value in values):
+            raise ValueError(f"incorrect value for keyword '{alias}' only integers and strings are accepted")
+        return f"{key} IN ({', '.join(['%s'] * len(values))})", list(map(str, values))
 
     def _str_exact_or_none_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for querying string fields, allowing
-        to use Python's "None" in addition.
+        Returns SQL query predicate and parameters for querying string fields,
+        allowing to use Python's "None" in addition.
         """
-        if None in values:
-            values_now = []
-            for value in values:
-                if value is not None:
-                    values_now.append(value)
-            if values_now:
-                clause = self._str_exact_clause(key, alias, values_now)
-                return f'{clause} OR {key} IS NULL'
+        values_now = [value for value in values if value is not None]
+        if len(values_now) == len(values):
+            return self._str_exact_clause(key, alias, values)
 
-            return f'{key} IS NULL'
+        if values_now:
+            clause, params = self._str_exact_clause(key, alias, values_now)
+            return f'{clause} OR {key} IS NULL', params
 
-        return self._str_exact_clause(key, alias, values)
+        return f'{key} IS NULL', []
 
     def _formula_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for querying formula fields.
+        Returns SQL query predicate and parameters for querying formula fields.
         """
-        for value in values:
-            if not isinstance(value, str):
-                raise ValueError(f"incorrect value for keyword '{alias}' only strings are accepted")
+        if not all(isinstance(value, str) for value in values):
+            raise ValueError(f"incorrect value for keyword '{alias}' only strings are accepted")
         return self._str_exact_clause(key, alias, [f'- {f} -' for f in values])
 
     def _str_fuzzy_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for fuzzy querying of string fields.
+        Returns SQL query predicate and parameters for fuzzy querying of string fields.
         """
-        clause_parts = []
-        for value in values:
-            if not isinstance(value, int) and not isinstance(value, str):
-                raise ValueError(f"incorrect value for keyword '{alias}' only integers and strings are accepted")
-            if isinstance(value, int):
-                value = str(value)
-            clause_parts.append(f"{key} LIKE '%{value}%'")
-        return ' OR '.join(clause_parts)
+        if not all(isinstance(value, (int, str)) for value in values):
+            raise ValueError(f"incorrect value for keyword '{alias}' only integers and strings are accepted")
+        return ' OR '.join([f'{key} LIKE %s'] * len(values)), [f'%{value}%' for value in values]
 
     def _composition_clause(self, _, alias, values):
         """
-        Returns SQL query predicate for querying elements in formula fields.
+        Returns SQL query predicate and parameters for querying elements in formula fields.
         """
-        clause_parts = []
-        for value in values:
-            if not isinstance(value, str):
-                raise ValueError(f"incorrect value for keyword '{alias}' only strings are accepted")
-            clause_parts.append(f"formula REGEXP ' {value}[0-9 ]'")
-        return ' AND '.join(clause_parts)
+        if not all(isinstance(value, str) for value in values):
+            raise ValueError(f"incorrect value for keyword '{alias}' only strings are accepted")
+        return ' AND '.join(['formula REGEXP %s'] * len(values)), [f' {value}[0-9 ]' for value in values]
 
     def _double_clause(self, key, alias, values, precision):
         """
-        Returns SQL query predicate for querying double-valued fields.
+        Returns SQL query predicate and parameters for querying double-valued fields.
         """
-        for value in values:
-            if not isinstance(value, int) and not isinstance(value, float):
-                raise ValueError(f"incorrect value for keyword '{alias}' only integers and floats are accepted")
-        return ' OR '.join(f'{key} BETWEEN {d - precision} AND {d + precision}' for d in values)
+        if not all(isinstance(value, (int, float)) for value in values):
+            raise ValueError(f"incorrect value for keyword '{alias}' only integers and floats are accepted")
+        params = [bound for value in values for bound in (value - precision, value + precision)]
+        return ' OR '.join([f'{key} BETWEEN %s AND %s'] * len(values)), params
 
     length_precision = 0.001
     angle_precision = 0.001
@@ -107,31 +100,31 @@ class CodDbImporter(DbImporter):
 
     def _length_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for querying lattice vector lengths.
+        Returns SQL query predicate and parameters for querying lattice vector lengths.
         """
         return self._double_clause(key, alias, values, self.length_precision)
 
     def _angle_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for querying lattice angles.
+        Returns SQL query predicate and parameters for querying lattice angles.
         """
         return self._double_clause(key, alias, values, self.angle_precision)
 
     def _volume_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for querying unit cell volume.
+        Returns SQL query predicate and parameters for querying unit cell volume.
         """
         return self._double_clause(key, alias, values, self.volume_precision)
 
     def _temperature_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for querying temperature.
+        Returns SQL query predicate and parameters for querying temperature.
         """
         return self._double_clause(key, alias, values, self.temperature_precision)
 
     def _pressure_clause(self, key, alias, values):
         """
-        Returns SQL query predicate for querying pressure.
+        Returns SQL query predicate and parameters for querying pressure.
         """
         return self._double_clause(key, alias, values, self.pressure_precision)
 
@@ -167,6 +160,9 @@ class CodDbImporter(DbImporter):
         'doi': ['doi', _str_exact_clause],
         'determination_method': ['method', _str_exact_or_none_clause]
     }
+    # ``(keyword, column, clause method)`` triples, sorted by keyword; a subclass
+    # that overrides ``_keywords`` but not ``query_statement`` has to rebuild it
+    _keywords_sorted = tuple((key, value[0], value[1]) for key, value in sorted(_keywords.items()))
 
     def __init__(self, **kwargs):
         self._db = None
@@ -181,18 +177,33 @@ class CodDbImporter(DbImporter):
 
         :return: string containing a SQL statement.
         """
+        sql, params = self.query_statement(**kwargs)
+        return sql % tuple(_sql_literal(param) for param in params)
+
+    def query_statement(self, **kwargs):
+        """
+        Forms a parameterized SQL query for querying the COD database using
+        ``keyword = value`` pairs, specified in ``kwargs``.
+
+        :return: tuple of the SQL statement with ``%s`` placeholders and the
+            list of parameters to be bound to them.
+        """
+        unknown = [key for key in kwargs if key not in self._keywords]
+        if unknown:
+            raise NotImplementedError(f"following keyword(s) are not implemented: {', '.join(unknown)}")
+
         sql_parts = ["(status IS NULL OR status != 'retracted')"]
-        for key in sorted(self._keywords.keys()):
+        params = []
+        for key, column, method in self._keywords_sorted:
             if key in kwargs:
-                values = kwargs.pop(key)
+                values = kwargs[key]
                 if not isinstance(values, list):
                     values = [values]
-                sql_parts.append(f'({self._keywords[key][1](self, self._keywords[key][0], key, values)})')
-
-        if kwargs:
-            raise NotImplementedError(f"following keyword(s) are not implemented: {', '.join(kwargs.keys())}")
+                clause, clause_params = method(self, column, key, values)
+                sql_parts.append(f'({clause})')
+                params.extend(clause_params)
 
-        return f"SELECT file, svnrevision FROM data WHERE {' AND '.join(sql_parts)}"
+        return f"SELECT file, svnrevision FROM data WHERE {' AND '.join(sql_parts)}", params
 
     def query(self, **kwargs):
         """
@@ -202,16 +213,18 @@ class CodDbImporter(DbImporter):
         :return: an instance of
             :py:class:`aiida.tools.dbimporters.plugins.cod.CodSearchResults`.
         """
-        query_statement = self.query_sql(**kwargs)
+        query_statement, query_params = self.query_statement(**kwargs)
         self._connect_db()
         results = []
         try:
-            self._cursor.execute(query_statement)
-            self._db.commit()
-            for row in self._cursor.fetchall():
+            self._cursor.execute(query_statement, tuple(query_params))
+            for row in self._cursor:
                 results.append({'id': str(row[0]), 'svnrevision': str(row[1])})
-        finally:
-            self._disconnect_db()
+        except Exception:
+            # The connection may be left with a partially read result, so it is dropped instead of being reused
+            self.close()
+            raise
+        self._cursor.close()
 
         return CodSearchResults(results)
 
@@ -227,6 +240,16 @@ class CodDbImporter(DbImporter):
                 "unknown database connection parameter(s): '" + "', '".join(kwargs.keys()) +
                 "', available parameters: '" + "', '".join(self._db_parameters.keys()) + "'"
             )
+        # An open connection uses the old details, so it is closed and a new one is made on the next query
+        self.close()
+
+    def close(self):
+        """
+        Closes the connection to the MySQL database, which is otherwise kept
+        open to be reused by subsequent queries. A later query reconnects.
+        """
+        if self._db is not None:
+            self._disconnect_db()
 
     def get_supported_keywords(self):
         """
@@ -239,25 +262,40 @@ class CodDbImporter(DbImporter):
     def _connect_db(self):
         """
         Connects to the MySQL database for performing searches.
+
+        The connection is kept open and reused by subsequent searches, after
+        checking that it is still alive and reconnecting if it is not.
         """
         try:
             import MySQLdb
+            from MySQLdb.cursors import SSCursor
         except ImportError:
             import pymysql as MySQLdb
-
-        self._db = MySQLdb.connect(
-            host=self._db_parameters['host'],
-            user=self._db_parameters['user'],
-            passwd=self._db_parameters['passwd'],
-            db=self._db_parameters['db']
-        )
-        self._cursor = self._db.cursor()
+            from pymysql.cursors import SSCursor
+
+        if self._db is None:
+            self._db = MySQLdb.connect(
+                host=self._db_parameters['host'],
+                user=self._db_parameters['user'],
+                passwd=self._db_parameters['passwd'],
+                db=self._db_parameters['db']
+            )
+            # The searches are read-only, and the connection outlives them. Without autocommit, the first search would
+            # open a transaction that is never ended, and all later searches would only see its snapshot of the data.
+            self._db.autocommit(True)
+        else:
+            self._db.ping(True)
+        # Use an unbuffered cursor, such that rows are streamed from the server while iterating over the results,
+        # instead of first being loaded into memory in their entirety.
+        self._cursor = self._db.cursor(SSCursor)
 
     def _disconnect_db(self):
         """
         Closes connection to the MySQL database.
         """
         self._db.close()
+        self._db = None
+        self._cursor = None
 
 
 class CodSearchResults(DbSearchResults):  # pylint: disable=abstract-method
@@ -37,24 +37,30 @@ class PcodDbImporter(CodDbImporter):
         self._db_parameters = {'host': 'www.crystallography.net', 'user': 'pcod_reader', 'passwd': '', 'db': 'pcod'}
         self.setup_db(**kwargs)
 
-    def query_sql(self, **kwargs):
+    def query_statement(self, **kwargs):
         """
-        Forms a SQL query for querying the PCOD database using
+        Forms a parameterized SQL query for querying the PCOD database using
         ``keyword = value`` pairs, specified in ``kwargs``.
 
-        :return: string containing a SQL statement.
+        :return: tuple of the SQL statement with ``%s`` placeholders and the
+            list of parameters to be bound to them.
         """
+        unknown = [key for key in kwargs if key not in self._keywords]
+        if unknown:
+            raise NotImplementedError(f"following keyword(s) are not implemented: {', '.join(unknown)}")
+
         sql_parts = []
+        params = []
         for key, value in self._keywords.items():
             if key in kwargs:
-                values = kwargs.pop(key)
+                values = kwargs[key]
                 if not isinstance(values, list):
                     values = [values]
-                sql_parts.append(f'({value[1](self, value[0], key, values)})')
-        if kwargs:
-            raise NotImplementedError(f"following keyword(s) are not implemented: {', '.join(kwargs.keys())}")
+                clause, clause_params = value[1](self, value[0], key, values)
+                sql_parts.append(f'({clause})')
+                params.extend(clause_params)
 
-        return f"SELECT file FROM data WHERE {' AND '.join(sql_parts)}"
+        return f"SELECT file FROM data WHERE {' AND '.join(sql_parts)}", params
 
     def query(self, **kwargs):
         """
@@ -64,16 +70,18 @@ class PcodDbImporter(CodDbImporter):
         :return: an instance of
             :py:class:`aiida.tools.dbimporters.plugins.pcod.PcodSearchResults`.
         """
-        query_statement = self.query_sql(**kwargs)
+        query_statement, query_params = self.query_statement(**kwargs)
         self._connect_db()
         results = []
         try:
-            self._cursor.execute(query_statement)
-            self._db.commit()
-            for row in self._cursor.fetchall():
+            self._cursor.execute(query_statement, tuple(query_params))
+            for row in self._cursor:
                 results.append({'id': str(row[0])})
-        finally:
-            self._disconnect_db()
+        except Exception:
+            # The connection may be left with a partially read result, so it is dropped instead of being reused
+            self.close()
+            raise
+        self._cursor.close()
 
         return PcodSearchResults(results)
 
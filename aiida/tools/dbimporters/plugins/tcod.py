@@ -29,16 +29,18 @@ class TcodDbImporter(CodDbImporter):
         :return: an instance of
             :py:class:`aiida.tools.dbimporters.plugins.tcod.TcodSearchResults`.
         """
-        query_statement = self.query_sql(**kwargs)
+        query_statement, query_params = self.query_statement(**kwargs)
         self._connect_db()
         results = []
         try:
-            self._cursor.execute(query_statement)
-            self._db.commit()
-            for row in self._cursor.fetchall():
+            self._cursor.execute(query_statement, tuple(query_params))
+            for row in self._cursor:
                 results.append({'id': str(row[0]), 'svnrevision': str(row[1])})
-        finally:
-            self._disconnect_db()
+        except Exception:
+            # The connection may be left with a partially read result, so it is dropped instead of being reused
+            self.close()
+            raise
+        self._cursor.close()
 
         return TcodSearchResults(results)
 
@@ -9,11 +9,78 @@
 ###########################################################################
 # pylint: disable=no-self-use
 """Tests for subclasses of DbImporter, DbSearchResults and DbEntry"""
+import sys
+import types
+
 import pytest
 
 from tests.static import STATIC_DIR
 
 
+@pytest.fixture
+def mock_mysqldb(monkeypatch):
+    """Replace the ``MySQLdb`` module by a mock, that serves the rows in ``mock_mysqldb.rows`` to every query.
+
+    :returns: the mock module, whose ``connections`` attribute lists the connections that were opened.
+    """
+
+    class SSCursor:
+        """Mock of the unbuffered cursor, which can only be iterated over."""
+
+        def __init__(self, rows):
+            self.rows = rows
+            self.executed = []
+            self.closed = False
+
+        def execute(self, query, args):
+            self.executed.append((query, args))
+
+        def __iter__(self):
+            return iter(self.rows)
+
+        def close(self):
+            self.closed = True
+
+    class Connection:
+        """Mock of a database connection."""
+
+        def __init__(self, **kwargs):
+            self.parameters = kwargs
+            self.autocommit_mode = False
+            self.pings = []
+            self.cursors = []
+            self.closed = False
+
+        def autocommit(self, value):
+            self.autocommit_mode = value
+
+        def ping(self, reconnect):
+            self.pings.append(reconnect)
+
+        def cursor(self, cursorclass):
+            cursor = cursorclass(module.rows)
+            self.cursors.append(cursor)
+            return cursor
+
+        def close(self):
+            self.closed = True
+
+    def connect(**kwargs):
+        connection = Connection(**kwargs)
+        module.connections.append(connection)
+        return connection
+
+    module = types.ModuleType('MySQLdb')
+    module.connect = connect
+    module.connections = []
+    module.rows = []
+    module.cursors = types.ModuleType('MySQLdb.cursors')
+    module.cursors.SSCursor = SSCursor
+    monkeypatch.setitem(sys.modules, 'MySQLdb', module)
+    monkeypatch.setitem(sys.modules, 'MySQLdb.cursors', module.cursors)
+    return module
+
+
 class TestCodDbImporter:
     """Test the CodDbImporter class."""
     from aiida.orm.nodes.data.cif import has_pycifrw  # type: ignore
@@ -68,6 +135,127 @@ class TestCodDbImporter:
                           '(vol BETWEEN 99.999 AND 100.001 OR ' \
                           'vol BETWEEN 120.004 AND 120.006)'
 
+    def test_query_statement(self):
+        """Test that the values are bound as parameters, rather than interpolated into the statement."""
+        from aiida.tools.dbimporters.plugins.cod import CodDbImporter
+
+        codi = CodDbImporter()
+        sql, params = codi.query_statement(
+            id=['1000000', 3000000],
+            chemical_name="caffeine'; DROP TABLE data; --",
+            volume=[100, 120.005],
+            determination_method=[None, 'single crystal']
+        )
+
+        assert sql == \
+                          'SELECT file, svnrevision FROM data WHERE ' \
+                          "(status IS NULL OR status != 'retracted') AND " \
+                          '(chemname LIKE %s) AND ' \
+                          '(method IN (%s) OR method IS NULL) AND ' \
+                          '(file IN (%s, %s)) AND ' \
+                          '(vol BETWEEN %s AND %s OR vol BETWEEN %s AND %s)'
+        assert params == [
+            "%caffeine'; DROP TABLE data; --%", 'single crystal', 1000000, 3000000, 100 - 0.001, 100 + 0.001,
+            120.005 - 0.001, 120.005 + 0.001
+        ]
+
+    def test_query_sql_quoting(self):
+        """Test that the textual rendering of the query escapes the quoted values."""
+        from aiida.tools.dbimporters.plugins.cod import CodDbImporter
+
+        codi = CodDbImporter()
+        q_sql = codi.query_sql(mineral_name="o'brienite", journal='a\\b')
+
+        assert q_sql == \
+                          'SELECT file, svnrevision FROM data WHERE ' \
+                          "(status IS NULL OR status != 'retracted') AND " \
+                          "(journal LIKE '%a\\\\b%') AND " \
+                          "(mineral LIKE '%o\\'brienite%')"
+
+    def test_query_precision_change(self):
+        """Test that a change of the precision applies to subsequent queries."""
+        from aiida.tools.dbimporters.plugins.cod import CodDbImporter
+
+        codi = CodDbImporter()
+        assert codi.query_statement(volume=100)[1] == [100 - 0.001, 100 + 0.001]
+
+        codi.volume_precision = 5
+        assert codi.query_statement(volume=100)[1] == [95, 105]
+
+    def test_query_unknown_keyword(self):
+        """Test that unknown keywords are rejected."""
+        from aiida.tools.dbimporters.plugins.cod import CodDbImporter
+
+        with pytest.raises(NotImplementedError, match='unknown'):
+            CodDbImporter().query_statement(id=1, unknown=1)
+
+    def test_query_connection(self, mock_mysqldb):
+        """Test that the connection is reused by subsequent queries, and that the results are streamed."""
+        from aiida.tools.dbimporters.plugins.cod import CodDbImporter
+
+        mock_mysqldb.rows = [(1000000, 123), (1000001, 456)]
+        codi = CodDbImporter()
+
+        results = codi.query(id=[1000000, 1000001])
+        assert [(entry.source['id'], entry.source['version']) for entry in results] == [('1000000', '123'),
+                                                                                        ('1000001', '456')]
+
+        codi.query(id=1000000)
+        assert len(mock_mysqldb.connections) == 1
+        connection = mock_mysqldb.connections[0]
+        assert connection.parameters['db'] == 'cod'
+        # the searches should not keep a transaction, and so a snapshot of the database, open on the reused connection
+        assert connection.autocommit_mode is True
+        # the open connection is checked, and reconnected if needed, before it is reused
+        assert connection.pings == [True]
+        assert all(isinstance(cursor, mock_mysqldb.cursors.SSCursor) for cursor in connection.cursors)
+        assert all(cursor.closed for cursor in connection.cursors)
+        assert connection.cursors[1].executed[0][1] == (1000000,)
+        assert not connection.closed
+
+        codi.close()
+        assert connection.closed
+        codi.close()
+
+        codi.query(id=1000000)
+        assert len(mock_mysqldb.connections) == 2
+
+    def test_query_failure_closes_connection(self, mock_mysqldb):
+        """Test that the connection is not reused, when a query fails while streaming the results."""
+        from aiida.tools.dbimporters.plugins.cod import CodDbImporter
+
+        def rows():
+            yield (1000000, 123)
+            raise RuntimeError('Lost connection to MySQL server during query')
+
+        mock_mysqldb.rows = rows()
+        codi = CodDbImporter()
+
+        with pytest.raises(RuntimeError, match='Lost connection'):
+            codi.query(id=[1000000, 1000001])
+        assert mock_mysqldb.connections[0].closed
+
+        mock_mysqldb.rows = []
+        codi.query(id=1000000)
+        assert len(mock_mysqldb.connections) == 2
+        assert not mock_mysqldb.connections[1].closed
+
+    def test_setup_db_closes_connection(self, mock_mysqldb):
+        """Test that changing the connection details closes the open connection."""
+        from aiida.tools.dbimporters.plugins.cod import CodDbImporter
+
+        codi = CodDbImporter()
+        codi.query(id=1000000)
+        connection = mock_mysqldb.connections[0]
+
+        codi.setup_db(host='localhost')
+        assert connection.closed
+
+        codi.query(id=1000000)
+        assert len(mock_mysqldb.connections) == 2
+        assert mock_mysqldb.connections[1].parameters['host'] == 'localhost'
+        assert mock_mysqldb.connections[1].pings == []
+
     def test_datatype_checks(self):
         """Rather complicated, but wide-coverage test for data types, accepted
         and rejected by CodDbImporter._*_clause methods."""
@@ -193,6 +381,33 @@ class TestTcodDbImporter:
 class TestPcodDbImporter:
     """Test the PcodDbImporter class."""
 
+    def test_query_construction(self):
+        """Test query construction, where the clauses follow the order in which the keywords are defined."""
+        from aiida.tools.dbimporters.plugins.pcod import PcodDbImporter
+
+        pcodi = PcodDbImporter()
+        q_sql = pcodi.query_sql(text='caffeine', volume=100, element=['C'], id=1)
+
+        assert q_sql == \
+                          'SELECT file FROM data WHERE ' \
+                          '(file IN (1)) AND ' \
+                          "(formula REGEXP ' C[0-9 ]') AND " \
+                          '(vol BETWEEN 99.999 AND 100.001) AND ' \
+                          "(text LIKE '%caffeine%')"
+
+    def test_query_statement(self):
+        """Test that the values are bound as parameters, without the status clause of COD."""
+        from aiida.tools.dbimporters.plugins.pcod import PcodDbImporter
+
+        pcodi = PcodDbImporter()
+        sql, params = pcodi.query_statement(id=[1, '2'], spacegroup='P -1', a=10)
+
+        assert sql == 'SELECT file FROM data WHERE (file IN (%s, %s)) AND (sg IN (%s)) AND (a BETWEEN %s AND %s)'
+        assert params == [1, 2, 'P -1', 10 - 0.001, 10 + 0.001]
+
+        with pytest.raises(NotImplementedError, match='chemical_name'):
+            pcodi.query_statement(chemical_name='caffeine')
+
     def test_dbentry_creation(self):
         """Tests the creation of PcodEntry from PcodSearchResults."""
         from aiida.tools.dbimporters.plugins.pcod import PcodSearchResults
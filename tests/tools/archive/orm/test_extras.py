@@ -94,6 +94,29 @@ def test_extras_import_mode_update_existing(new_archive):
     assert imported_node.base.extras.get('c') == 3
 
 
+def test_extras_import_mode_update_existing_unchanged(new_archive):
+    """Check that a node is not updated if merging leaves its extras unchanged"""
+    imported_node = import_extras(new_archive)
+    mtime = imported_node.mtime
+
+    import_archive(new_archive, merge_extras=('k', 'c', 'u'))
+
+    imported_node = orm.load_node(imported_node.pk)
+    assert imported_node.base.extras.all == {'b': 2, 'c': 3}
+    assert imported_node.mtime == mtime
+
+
+def test_extras_import_mode_update_existing_type(new_archive):
+    """Check that an extra is updated if its value only differs in type from the imported one"""
+    imported_node = import_extras(new_archive)
+    imported_node.base.extras.set('b', 2.0)
+
+    import_archive(new_archive, merge_extras=('k', 'c', 'u'))
+
+    imported_node = orm.load_node(imported_node.pk)
+    assert isinstance(imported_node.base.extras.get('b'), int)
+
+
 def test_extras_import_mode_mirror(new_archive):
     """Check if old extras are fully overwritten by the imported ones
     (not keep original, create new, update original)"""
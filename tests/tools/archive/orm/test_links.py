@@ -8,10 +8,12 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """orm links tests for the export and import routines"""
+import pytest
+
 from aiida import orm
 from aiida.common.links import LinkType
 from aiida.orm.entities import EntityTypes
-from aiida.tools.archive import ArchiveFormatSqlZip, create_archive, import_archive
+from aiida.tools.archive import ArchiveFormatSqlZip, ImportUniquenessError, create_archive, import_archive
 from tests.tools.archive.utils import get_all_node_links
 
 
@@ -643,3 +645,37 @@ def test_multiple_post_return_links(tmp_path, aiida_profile_clean):  # pylint: d
         2, \
         f'Exactly two Links are expected, instead {len(links)} were found (in, out, label, type): {links}'
     assert sorted(links) == sorted(before_links)
+
+
+def test_import_second_incoming_create_link(tmp_path, aiida_profile_clean):
+    """Test that importing a second incoming CREATE link into an existing node is refused."""
+    calc_existing = orm.CalculationNode().store()
+    calc_other = orm.CalculationNode().store()
+    data = orm.Int(1)
+    data.base.links.add_incoming(calc_existing, LinkType.CREATE, 'result')
+    data.store()
+    calc_existing.seal()
+    calc_other.seal()
+
+    filename = tmp_path.joinpath('export.aiida')
+    create_archive([data, calc_other], filename=filename)
+
+    # add a second CREATE link into the data node, which would not be allowed by the provenance rules
+    with ArchiveFormatSqlZip().open(filename, 'r') as archive:
+        uuid_filters = {'uuid': {'in': [calc_other.uuid, data.uuid]}}
+        node_ids = dict(archive.querybuilder().append(orm.Node, filters=uuid_filters, project=['uuid', 'id']).all())
+        link_ids = [link_id for link_id, in archive.querybuilder().append(entity_type='link', project='id').all()]
+    with ArchiveFormatSqlZip().open(filename, 'a') as archive:
+        archive.bulk_insert(
+            EntityTypes.LINK, [{
+                'id': max(link_ids) + 1,
+                'input_id': node_ids[calc_other.uuid],
+                'output_id': node_ids[data.uuid],
+                'label': 'other_result',
+                'type': LinkType.CREATE.value,
+            }]
+        )
+
+    # the existing CREATE link is skipped, but the new one clashes with it, since a node can only be created once
+    with pytest.raises(ImportUniquenessError, match='already has an incoming'):
+        import_archive(filename)